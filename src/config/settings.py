@@ -6,22 +6,59 @@ All configuration is centralized here for easy maintenance and testing.
 """
 
 import os
+import sys
 import logging
-from typing import Optional, List
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, FrozenSet, Optional, Tuple
 from pathlib import Path
 
 
+# Snapshot of the environment taken once at import; settings are read from here
+_E = os.environ.copy()
+
+# Values accepted as "enabled" for boolean flags
+_TRUTHY = {"true", "1", "yes", "on"}
+
+# Supported log level names and their numeric values
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def _g(key: str, default: Any = None, cast: Callable[[str], Any] = str) -> Any:
+    """Read a setting from the environment snapshot, casting it when present."""
+    value = _E.get(key)
+    return cast(value) if value is not None else default
+
+
+def _flag(key: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment snapshot."""
+    value = _E.get(key)
+    return value.lower() in _TRUTHY if value is not None else default
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings with environment variable support."""
+    """
+    Application settings with environment variable support.
+    
+    Defaults are resolved from the environment snapshot at import; any field
+    can be overridden by keyword for testing (e.g. ``Settings(PORT=9000)``)
+    or by a plain class attribute in a subclass (e.g. ``DEBUG = True``).
+    """
     
     # =========================================================================
     # Server Configuration
     # =========================================================================
     
-    SERVER_NAME: str = os.getenv("MCP_SERVER_NAME", "MCP Server Template")
-    SERVER_VERSION: str = os.getenv("MCP_SERVER_VERSION", "1.0.0")
-    SERVER_DESCRIPTION: str = os.getenv(
-        "MCP_SERVER_DESCRIPTION", 
+    SERVER_NAME: str = _g("MCP_SERVER_NAME", "MCP Server Template")
+    SERVER_VERSION: str = _g("MCP_SERVER_VERSION", "1.0.0")
+    SERVER_DESCRIPTION: str = _g(
+        "MCP_SERVER_DESCRIPTION",
         "A robust template for building FastMCP servers"
     )
     
@@ -29,61 +66,65 @@ class Settings:
     # Network Configuration
     # =========================================================================
     
-    HOST: str = os.getenv("MCP_HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("MCP_PORT", "8000"))
-    TRANSPORT: str = os.getenv("MCP_TRANSPORT", "http").lower()
+    HOST: str = _g("MCP_HOST", "0.0.0.0")
+    PORT: int = _g("MCP_PORT", 8000, int)
+    TRANSPORT: str = _g("MCP_TRANSPORT", "http", str.lower)
     
     # =========================================================================
     # Feature Flags
     # =========================================================================
     
-    ENABLE_HEALTH_CHECK: bool = os.getenv("ENABLE_HEALTH_CHECK", "true").lower() == "true"
-    ENABLE_METRICS: bool = os.getenv("ENABLE_METRICS", "false").lower() == "true"
-    ENABLE_CORS: bool = os.getenv("ENABLE_CORS", "true").lower() == "true"
-    ENABLE_LOGGING: bool = os.getenv("ENABLE_LOGGING", "true").lower() == "true"
+    ENABLE_HEALTH_CHECK: bool = _flag("ENABLE_HEALTH_CHECK", True)
+    ENABLE_METRICS: bool = _flag("ENABLE_METRICS")
+    ENABLE_CORS: bool = _flag("ENABLE_CORS", True)
+    ENABLE_LOGGING: bool = _flag("ENABLE_LOGGING", True)
     
     # =========================================================================
     # Security Configuration
     # =========================================================================
     
-    API_KEY: Optional[str] = os.getenv("API_KEY")
-    REQUIRE_AUTH: bool = API_KEY is not None
-    CORS_ORIGINS: List[str] = os.getenv("CORS_ORIGINS", "*").split(",")
-    CORS_METHODS: List[str] = os.getenv("CORS_METHODS", "GET,POST,PUT,DELETE").split(",")
+    API_KEY: Optional[str] = _g("API_KEY")
+    REQUIRE_AUTH: Optional[bool] = None  # None: derived from API_KEY
+    CORS_ORIGINS: FrozenSet[str] = frozenset(
+        sys.intern(origin.strip()) for origin in _E.get("CORS_ORIGINS", "*").split(",")
+    )
+    CORS_METHODS: Tuple[str, ...] = tuple(
+        method.strip().upper() for method in _E.get("CORS_METHODS", "GET,POST,PUT,DELETE").split(",")
+    )
     
     # =========================================================================
     # Logging Configuration
     # =========================================================================
     
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
-    LOG_FORMAT: str = os.getenv(
-        "LOG_FORMAT", 
+    LOG_LEVEL: str = _g("LOG_LEVEL", "INFO", str.upper)
+    LOG_FORMAT: str = _g(
+        "LOG_FORMAT",
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    LOG_FILE: Optional[str] = os.getenv("LOG_FILE")
+    LOG_FILE: Optional[str] = _g("LOG_FILE")
     
     # =========================================================================
     # Performance Configuration
     # =========================================================================
     
-    MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "4"))
-    TIMEOUT_SECONDS: int = int(os.getenv("TIMEOUT_SECONDS", "30"))
-    MAX_REQUEST_SIZE: int = int(os.getenv("MAX_REQUEST_SIZE", "1048576"))  # 1MB
+    MAX_WORKERS: int = _g("MAX_WORKERS", 4, int)
+    TIMEOUT_SECONDS: int = _g("TIMEOUT_SECONDS", 30, int)
+    MAX_REQUEST_SIZE: int = _g("MAX_REQUEST_SIZE", 1048576, int)  # 1MB
     
     # =========================================================================
     # Development Configuration
     # =========================================================================
     
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
-    RELOAD: bool = os.getenv("RELOAD", "false").lower() == "true"
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "production").lower()
+    DEBUG: bool = _flag("DEBUG")
+    RELOAD: bool = _flag("RELOAD")
+    ENVIRONMENT: str = _g("ENVIRONMENT", "production", str.lower)
     
     # =========================================================================
     # Database Configuration (if needed)
     # =========================================================================
     
-    DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")
-    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    DATABASE_URL: Optional[str] = _g("DATABASE_URL")
+    REDIS_URL: Optional[str] = _g("REDIS_URL")
     
     # =========================================================================
     # External Services Configuration
@@ -91,8 +132,43 @@ class Settings:
     
     # Add your external service configurations here
     # Example:
-    # OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    # ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
+    # OPENAI_API_KEY: Optional[str] = _g("OPENAI_API_KEY")
+    # ANTHROPIC_API_KEY: Optional[str] = _g("ANTHROPIC_API_KEY")
+    
+    # =========================================================================
+    # Computed Values (cached in __post_init__)
+    # =========================================================================
+    
+    _is_development: bool = field(init=False, repr=False, compare=False)
+    _is_production: bool = field(init=False, repr=False, compare=False)
+    _server_url: str = field(init=False, repr=False, compare=False)
+    _mcp_endpoint: str = field(init=False, repr=False, compare=False)
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Turn plain class-attribute overrides in subclasses into field defaults."""
+        # Zero-argument super() would bind the pre-slots class
+        super(Settings, cls).__init_subclass__(**kwargs)
+        
+        annotations = dict(cls.__dict__.get("__annotations__", {}))
+        for f in fields(cls):
+            if f.init and f.name in cls.__dict__ and f.name not in annotations:
+                annotations[f.name] = f.type
+        cls.__annotations__ = annotations
+        
+        # Regenerate __init__ with the subclass defaults; keep the base __repr__
+        dataclass(frozen=True, repr=False)(cls)
+    
+    def __post_init__(self) -> None:
+        """Compute derived settings once; the instance is frozen afterwards."""
+        protocol = "http" if not self.API_KEY else "https"
+        server_url = f"{protocol}://{self.HOST}:{self.PORT}"
+        
+        if self.REQUIRE_AUTH is None:
+            object.__setattr__(self, "REQUIRE_AUTH", self.API_KEY is not None)
+        object.__setattr__(self, "_is_development", self.ENVIRONMENT == "development" or self.DEBUG)
+        object.__setattr__(self, "_is_production", self.ENVIRONMENT == "production" and not self.DEBUG)
+        object.__setattr__(self, "_server_url", server_url)
+        object.__setattr__(self, "_mcp_endpoint", f"{server_url}/mcp")
     
     # =========================================================================
     # Validation and Computed Properties
@@ -101,28 +177,27 @@ class Settings:
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
-        return self.ENVIRONMENT == "development" or self.DEBUG
+        return self._is_development
     
     @property
     def is_production(self) -> bool:
         """Check if running in production mode."""
-        return self.ENVIRONMENT == "production" and not self.DEBUG
+        return self._is_production
     
     @property
     def log_level_int(self) -> int:
         """Get log level as integer."""
-        return getattr(logging, self.LOG_LEVEL, logging.INFO)
+        return _LEVELS.get(self.LOG_LEVEL, logging.INFO)
     
     @property
     def server_url(self) -> str:
         """Get the full server URL."""
-        protocol = "http" if not self.API_KEY else "https"
-        return f"{protocol}://{self.HOST}:{self.PORT}"
+        return self._server_url
     
     @property
     def mcp_endpoint(self) -> str:
         """Get the MCP endpoint URL."""
-        return f"{self.server_url}/mcp"
+        return self._mcp_endpoint
     
     def validate(self) -> None:
         """Validate configuration settings."""
@@ -138,9 +213,8 @@ class Settings:
             errors.append(f"Invalid port: {self.PORT}. Must be between 1 and 65535")
         
         # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.LOG_LEVEL not in valid_log_levels:
-            errors.append(f"Invalid log level: {self.LOG_LEVEL}. Must be one of {valid_log_levels}")
+        if self.LOG_LEVEL not in _LEVELS:
+            errors.append(f"Invalid log level: {self.LOG_LEVEL}. Must be one of {list(_LEVELS)}")
         
         # Validate workers
         if self.MAX_WORKERS < 1:
@@ -151,18 +225,21 @@ class Settings:
     
     def to_dict(self) -> dict:
         """Convert settings to dictionary (excluding sensitive data)."""
-        sensitive_keys = {"API_KEY", "DATABASE_URL", "REDIS_URL"}
-        
-        return {
-            key: value for key, value in self.__dict__.items()
-            if not key.startswith("_") and key not in sensitive_keys
-        }
+        return {key: getattr(self, key) for key in _PUBLIC_FIELDS}
     
     def __repr__(self) -> str:
         """String representation of settings."""
         return f"Settings(server={self.SERVER_NAME}, host={self.HOST}:{self.PORT}, env={self.ENVIRONMENT})"
 
 
+# Serializable setting names, resolved once from the dataclass fields
+_SENSITIVE_FIELDS = {"API_KEY", "DATABASE_URL", "REDIS_URL"}
+_PUBLIC_FIELDS = tuple(
+    f.name for f in fields(Settings)
+    if f.name.isupper() and f.name not in _SENSITIVE_FIELDS
+)
+
+
 # Global settings instance
 settings = Settings()
 
@@ -175,11 +252,19 @@ except ValueError as e:
         raise
 
 
+# Set once logging has been configured so repeated calls are no-ops
+_LOGGING_CONFIGURED = False
+
+
 def configure_logging() -> None:
     """Configure application logging based on settings."""
-    if not settings.ENABLE_LOGGING:
+    global _LOGGING_CONFIGURED
+    
+    if _LOGGING_CONFIGURED or not settings.ENABLE_LOGGING:
         return
     
+    _LOGGING_CONFIGURED = True
+    
     # Configure logging format
     formatter = logging.Formatter(settings.LOG_FORMAT)
     
@@ -216,5 +301,7 @@ def configure_logging() -> None:
         logging.getLogger("uvicorn").setLevel(logging.WARNING)
 
 
-# Configure logging on import
-configure_logging() 
\ No newline at end of file
+# Configure logging on import, unless MCP_SKIP_LOGGING_SETUP is set by an
+# embedding application that configures logging itself
+if not _flag("MCP_SKIP_LOGGING_SETUP"):
+    configure_logging() 
\ No newline at end of file
@@ -5,6 +5,7 @@ This module handles loading and registration of all MCP prompts.
 Add your prompt implementations to this package and register them here.
 """
 
+import asyncio
 import importlib
 import logging
 from typing import TYPE_CHECKING
@@ -19,8 +20,9 @@ async def load_prompts(mcp: "FastMCP") -> int:
     """
     Load all prompts into the MCP server.
     
-    This function dynamically imports and registers all prompt modules.
-    Add new prompt modules to the PROMPT_MODULES list below.
+    This function dynamically imports all prompt modules and calls each
+    module's ``register(mcp)`` hook. Add new prompt modules to the
+    PROMPT_MODULES list below.
     
     Args:
         mcp: The FastMCP server instance
@@ -39,31 +41,53 @@ async def load_prompts(mcp: "FastMCP") -> int:
     
     prompts_loaded = 0
     
-    for module_name in PROMPT_MODULES:
-        try:
-            logger.debug(f"Loading prompt module: {module_name}")
-            
-            # Import the module - this will register its prompts with the MCP instance
-            importlib.import_module(module_name)
-            
-            # Count would be handled by the prompt decorators in each module
-            # For now, we'll assume each module adds at least one prompt
-            prompts_loaded += 1
-            
-            logger.debug(f"Successfully loaded prompt module: {module_name}")
-            
-        except ImportError as e:
-            logger.warning(f"Failed to import prompt module {module_name}: {e}")
-        except Exception as e:
-            logger.error(f"Error loading prompt module {module_name}: {e}")
-            # Don't raise here - we want to continue loading other modules
+    logger.debug(f"Loading prompt modules: {', '.join(PROMPT_MODULES)}")
     
-    logger.info(f"Loaded {prompts_loaded} prompt modules")
+    # Import the modules in parallel threads. Failures are collected rather
+    # than raised so the remaining modules still load.
+    results = await asyncio.gather(
+        *(asyncio.to_thread(importlib.import_module, module_name) for module_name in PROMPT_MODULES),
+        return_exceptions=True
+    )
+    
+    for module_name, result in zip(PROMPT_MODULES, results):
+        if isinstance(result, ImportError):
+            logger.warning(f"Failed to import prompt module {module_name}: {result}")
+        elif isinstance(result, Exception):
+            logger.error(f"Error loading prompt module {module_name}: {result}")
+        else:
+            try:
+                # Register the module's prompts with the server's MCP instance
+                prompts_loaded += result.register(mcp)
+                
+                logger.debug(f"Successfully loaded prompt module: {module_name}")
+                
+            except Exception as e:
+                logger.error(f"Error registering prompt module {module_name}: {e}")
+    
+    logger.info(f"Loaded {prompts_loaded} prompts")
     return prompts_loaded
 
 
-# Re-export commonly used classes for convenience
-from .example_prompts import *
+# Names re-exported from example_prompts, imported lazily on first access so
+# importing this package does not register the example prompts
+_PROMPT_NAMES = frozenset({
+    "code_review_prompt",
+    "data_analysis_prompt",
+    "api_documentation_prompt",
+    "bug_report_prompt",
+    "feature_planning_prompt",
+    "refactoring_guide_prompt",
+})
+
+
+def __getattr__(name: str):
+    """Lazily resolve re-exported prompts (PEP 562)."""
+    if name in _PROMPT_NAMES:
+        from . import example_prompts
+        return getattr(example_prompts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "load_prompts",
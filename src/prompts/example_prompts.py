@@ -8,11 +8,29 @@ structured prompt templates for LLM interactions.
 from fastmcp import FastMCP
 from typing import Dict, Any, List, Optional
 
-# Get the global FastMCP instance
-mcp = FastMCP("MCP Server Template")
+# Static fragments of the code-review prompt
+_CODE_REVIEW_PRE = "Please review the following "
+_CODE_REVIEW_MID = " code and provide feedback:\n\n```"
+_CODE_REVIEW_CRITERIA = """
+```
+
+Review criteria:
+- Code quality and readability
+- Best practices adherence
+- Potential bugs or issues
+- Performance considerations
+- Security concerns
+- Documentation quality"""
+_CODE_REVIEW_SUFFIX = """
+
+Please provide:
+1. Overall assessment
+2. Specific issues found
+3. Suggestions for improvement
+4. Positive aspects of the code
+"""
 
 
-@mcp.prompt("code-review")
 async def code_review_prompt(
     code: str,
     language: str = "python",
@@ -33,29 +51,35 @@ async def code_review_prompt(
     if focus_areas:
         focus_text = f"\nPlease pay special attention to: {', '.join(focus_areas)}"
     
-    return f"""Please review the following {language} code and provide feedback:
+    return "".join((
+        _CODE_REVIEW_PRE, language, _CODE_REVIEW_MID, language, "\n", code,
+        _CODE_REVIEW_CRITERIA, focus_text, _CODE_REVIEW_SUFFIX
+    ))
 
-```{language}
-{code}
-```
 
-Review criteria:
-- Code quality and readability
-- Best practices adherence
-- Potential bugs or issues
-- Performance considerations
-- Security concerns
-- Documentation quality{focus_text}
+# Static fragments of the data-analysis prompt
+_DATA_ANALYSIS_PRE = "I have a "
+_DATA_ANALYSIS_MID = """ dataset with the following characteristics:
+
+"""
+_DATA_ANALYSIS_GOALS = """
+
+I want to perform the following analysis:
+"""
+_DATA_ANALYSIS_SUFFIX = """
 
 Please provide:
-1. Overall assessment
-2. Specific issues found
-3. Suggestions for improvement
-4. Positive aspects of the code
+1. A step-by-step analysis plan
+2. Appropriate statistical methods to use
+3. Python code examples for the analysis
+4. Visualization suggestions
+5. Potential insights to look for
+6. Common pitfalls to avoid
+
+Focus on actionable insights and clear, interpretable results.
 """
 
 
-@mcp.prompt("data-analysis")
 async def data_analysis_prompt(
     data_description: str,
     analysis_goals: List[str],
@@ -72,28 +96,35 @@ async def data_analysis_prompt(
     Returns:
         String containing the formatted prompt
     """
-    goals_text = "\n".join([f"- {goal}" for goal in analysis_goals])
+    goals_text = "\n".join(f"- {goal}" for goal in analysis_goals)
     
-    return f"""I have a {data_format} dataset with the following characteristics:
+    return "".join((
+        _DATA_ANALYSIS_PRE, data_format, _DATA_ANALYSIS_MID, data_description,
+        _DATA_ANALYSIS_GOALS, goals_text, _DATA_ANALYSIS_SUFFIX
+    ))
 
-{data_description}
 
-I want to perform the following analysis:
-{goals_text}
+# Static fragments of the api-documentation prompt
+_API_DOC_PRE = """Please create comprehensive API documentation for the following endpoint:
 
-Please provide:
-1. A step-by-step analysis plan
-2. Appropriate statistical methods to use
-3. Python code examples for the analysis
-4. Visualization suggestions
-5. Potential insights to look for
-6. Common pitfalls to avoid
+**Endpoint:** """
+_API_DOC_DESCRIPTION = "\n**Description:** "
+_API_DOC_PARAMETERS = "\n\n**Parameters:**\n"
+_API_DOC_SUFFIX = """
 
-Focus on actionable insights and clear, interpretable results.
+Please include:
+1. Complete endpoint description
+2. Request/response examples
+3. Parameter validation rules
+4. Error response formats
+5. Usage examples in curl and Python
+6. Rate limiting information (if applicable)
+7. Authentication requirements (if any)
+
+Format the documentation in a clear, developer-friendly manner with proper code examples.
 """
 
 
-@mcp.prompt("api-documentation")
 async def api_documentation_prompt(
     endpoint_name: str,
     method: str,
@@ -114,30 +145,36 @@ async def api_documentation_prompt(
     """
     params_text = ""
     if parameters:
-        params_text = "\n".join([f"- {name}: {desc}" for name, desc in parameters.items()])
+        params_text = "\n".join(f"- {name}: {desc}" for name, desc in parameters.items())
     
-    return f"""Please create comprehensive API documentation for the following endpoint:
+    return "".join((
+        _API_DOC_PRE, method, " ", endpoint_name, _API_DOC_DESCRIPTION, description,
+        _API_DOC_PARAMETERS, params_text, _API_DOC_SUFFIX
+    ))
 
-**Endpoint:** {method} {endpoint_name}
-**Description:** {description}
 
-**Parameters:**
-{params_text}
+# Static fragments of the bug-report prompt
+_BUG_REPORT_PRE = """Please help me create a comprehensive bug report for the following issue:
 
-Please include:
-1. Complete endpoint description
-2. Request/response examples
-3. Parameter validation rules
-4. Error response formats
-5. Usage examples in curl and Python
-6. Rate limiting information (if applicable)
-7. Authentication requirements (if any)
+**Issue Description:**
+"""
+_BUG_REPORT_STEPS = "\n\n**Steps to Reproduce:**\n"
+_BUG_REPORT_EXPECTED = "\n\n**Expected Behavior:**\n"
+_BUG_REPORT_ACTUAL = "\n\n**Actual Behavior:**\n"
+_BUG_REPORT_SUFFIX = """
 
-Format the documentation in a clear, developer-friendly manner with proper code examples.
+Please provide:
+1. A well-structured bug report
+2. Additional information that might be helpful
+3. Potential root causes
+4. Suggested debugging steps
+5. Workarounds (if any)
+6. Priority level assessment
+
+Format this as a professional bug report suitable for a development team.
 """
 
 
-@mcp.prompt("bug-report")
 async def bug_report_prompt(
     issue_description: str,
     steps_to_reproduce: List[str],
@@ -158,39 +195,39 @@ async def bug_report_prompt(
     Returns:
         String containing the formatted prompt
     """
-    steps_text = "\n".join([f"{i+1}. {step}" for i, step in enumerate(steps_to_reproduce)])
+    steps_text = "\n".join(f"{i}. {step}" for i, step in enumerate(steps_to_reproduce, 1))
     
     env_text = ""
     if environment_info:
-        env_text = "\n**Environment:**\n" + "\n".join([f"- {k}: {v}" for k, v in environment_info.items()])
+        env_text = "\n**Environment:**\n" + "\n".join(f"- {k}: {v}" for k, v in environment_info.items())
     
-    return f"""Please help me create a comprehensive bug report for the following issue:
-
-**Issue Description:**
-{issue_description}
+    return "".join((
+        _BUG_REPORT_PRE, issue_description, _BUG_REPORT_STEPS, steps_text, _BUG_REPORT_EXPECTED,
+        expected_behavior, _BUG_REPORT_ACTUAL, actual_behavior, env_text, _BUG_REPORT_SUFFIX
+    ))
 
-**Steps to Reproduce:**
-{steps_text}
 
-**Expected Behavior:**
-{expected_behavior}
+# Static fragments of the feature-planning prompt
+_FEATURE_PLAN_PRE = """Please help me plan the following feature:
 
-**Actual Behavior:**
-{actual_behavior}{env_text}
+**Feature Name:** """
+_FEATURE_PLAN_DESCRIPTION = "\n\n**Description:**\n"
+_FEATURE_PLAN_STORIES = "\n\n**User Stories:**\n"
+_FEATURE_PLAN_SUFFIX = """
 
 Please provide:
-1. A well-structured bug report
-2. Additional information that might be helpful
-3. Potential root causes
-4. Suggested debugging steps
-5. Workarounds (if any)
-6. Priority level assessment
+1. Detailed requirements analysis
+2. Technical architecture suggestions
+3. Implementation phases/milestones
+4. Potential risks and mitigation strategies
+5. Testing strategy
+6. Success metrics
+7. Timeline estimation approach
 
-Format this as a professional bug report suitable for a development team.
+Focus on creating a comprehensive plan that addresses both technical and business aspects.
 """
 
 
-@mcp.prompt("feature-planning")
 async def feature_planning_prompt(
     feature_name: str,
     feature_description: str,
@@ -209,36 +246,37 @@ async def feature_planning_prompt(
     Returns:
         String containing the formatted prompt
     """
-    stories_text = "\n".join([f"- {story}" for story in user_stories])
+    stories_text = "\n".join(f"- {story}" for story in user_stories)
     
     constraints_text = ""
     if constraints:
-        constraints_text = "\n\n**Constraints:**\n" + "\n".join([f"- {constraint}" for constraint in constraints])
+        constraints_text = "\n\n**Constraints:**\n" + "\n".join(f"- {constraint}" for constraint in constraints)
     
-    return f"""Please help me plan the following feature:
+    return "".join((
+        _FEATURE_PLAN_PRE, feature_name, _FEATURE_PLAN_DESCRIPTION, feature_description,
+        _FEATURE_PLAN_STORIES, stories_text, constraints_text, _FEATURE_PLAN_SUFFIX
+    ))
 
-**Feature Name:** {feature_name}
 
-**Description:**
-{feature_description}
-
-**User Stories:**
-{stories_text}{constraints_text}
+# Static fragments of the refactoring-guide prompt
+_REFACTORING_PRE = "Please help me refactor the following "
+_REFACTORING_MID = " code:\n\n```"
+_REFACTORING_ISSUES = "\n```\n\n**Current Issues:**\n"
+_REFACTORING_GOALS = "\n\n**Refactoring Goals:**\n"
+_REFACTORING_SUFFIX = """
 
 Please provide:
-1. Detailed requirements analysis
-2. Technical architecture suggestions
-3. Implementation phases/milestones
-4. Potential risks and mitigation strategies
-5. Testing strategy
-6. Success metrics
-7. Timeline estimation approach
+1. Step-by-step refactoring plan
+2. Refactored code with explanations
+3. Design patterns that could be applied
+4. Testing strategy for the refactored code
+5. Performance implications
+6. Backward compatibility considerations
 
-Focus on creating a comprehensive plan that addresses both technical and business aspects.
+Focus on clean, maintainable code that follows best practices.
 """
 
 
-@mcp.prompt("refactoring-guide")
 async def refactoring_guide_prompt(
     code_snippet: str,
     current_issues: List[str],
@@ -257,35 +295,43 @@ async def refactoring_guide_prompt(
     Returns:
         String containing the formatted prompt
     """
-    issues_text = "\n".join([f"- {issue}" for issue in current_issues])
-    goals_text = "\n".join([f"- {goal}" for goal in refactoring_goals])
+    issues_text = "\n".join(f"- {issue}" for issue in current_issues)
+    goals_text = "\n".join(f"- {goal}" for goal in refactoring_goals)
     
-    return f"""Please help me refactor the following {language} code:
-
-```{language}
-{code_snippet}
-```
-
-**Current Issues:**
-{issues_text}
+    return "".join((
+        _REFACTORING_PRE, language, _REFACTORING_MID, language, "\n", code_snippet,
+        _REFACTORING_ISSUES, issues_text, _REFACTORING_GOALS, goals_text, _REFACTORING_SUFFIX
+    ))
 
-**Refactoring Goals:**
-{goals_text}
 
-Please provide:
-1. Step-by-step refactoring plan
-2. Refactored code with explanations
-3. Design patterns that could be applied
-4. Testing strategy for the refactored code
-5. Performance implications
-6. Backward compatibility considerations
-
-Focus on clean, maintainable code that follows best practices.
-"""
+def register(mcp: FastMCP) -> int:
+    """
+    Register the example prompts with the server's MCP instance.
+    
+    Args:
+        mcp: The FastMCP server instance
+        
+    Returns:
+        Number of prompts registered
+    """
+    prompts = {
+        "code-review": code_review_prompt,
+        "data-analysis": data_analysis_prompt,
+        "api-documentation": api_documentation_prompt,
+        "bug-report": bug_report_prompt,
+        "feature-planning": feature_planning_prompt,
+        "refactoring-guide": refactoring_guide_prompt,
+    }
+    
+    for name, prompt in prompts.items():
+        mcp.prompt(name)(prompt)
+    
+    return len(prompts)
 
 
 # Export all prompts for the module loader
 __all__ = [
+    "register",
     "code_review_prompt",
     "data_analysis_prompt",
     "api_documentation_prompt",
@@ -5,6 +5,7 @@ This module handles loading and registration of all MCP resources.
 Add your resource implementations to this package and register them here.
 """
 
+import asyncio
 import importlib
 import logging
 from typing import TYPE_CHECKING
@@ -19,8 +20,9 @@ async def load_resources(mcp: "FastMCP") -> int:
     """
     Load all resources into the MCP server.
     
-    This function dynamically imports and registers all resource modules.
-    Add new resource modules to the RESOURCE_MODULES list below.
+    This function dynamically imports all resource modules and calls each
+    module's ``register(mcp)`` hook. Add new resource modules to the
+    RESOURCE_MODULES list below.
     
     Args:
         mcp: The FastMCP server instance
@@ -39,32 +41,34 @@ async def load_resources(mcp: "FastMCP") -> int:
     
     resources_loaded = 0
     
-    for module_name in RESOURCE_MODULES:
-        try:
-            logger.debug(f"Loading resource module: {module_name}")
-            
-            # Import the module - this will register its resources with the MCP instance
-            importlib.import_module(module_name)
-            
-            # Count would be handled by the resource decorators in each module
-            # For now, we'll assume each module adds at least one resource
-            resources_loaded += 1
-            
-            logger.debug(f"Successfully loaded resource module: {module_name}")
-            
-        except ImportError as e:
-            logger.warning(f"Failed to import resource module {module_name}: {e}")
-        except Exception as e:
-            logger.error(f"Error loading resource module {module_name}: {e}")
-            # Don't raise here - we want to continue loading other modules
+    logger.debug(f"Loading resource modules: {', '.join(RESOURCE_MODULES)}")
     
-    logger.info(f"Loaded {resources_loaded} resource modules")
+    # Import the modules in parallel threads. Failures are collected rather
+    # than raised so the remaining modules still load.
+    results = await asyncio.gather(
+        *(asyncio.to_thread(importlib.import_module, module_name) for module_name in RESOURCE_MODULES),
+        return_exceptions=True
+    )
+    
+    for module_name, result in zip(RESOURCE_MODULES, results):
+        if isinstance(result, ImportError):
+            logger.warning(f"Failed to import resource module {module_name}: {result}")
+        elif isinstance(result, Exception):
+            logger.error(f"Error loading resource module {module_name}: {result}")
+        else:
+            try:
+                # Register the module's resources with the server's MCP instance
+                resources_loaded += result.register(mcp)
+                
+                logger.debug(f"Successfully loaded resource module: {module_name}")
+                
+            except Exception as e:
+                logger.error(f"Error registering resource module {module_name}: {e}")
+    
+    logger.info(f"Loaded {resources_loaded} resources")
     return resources_loaded
 
 
-# Re-export commonly used classes for convenience
-from .example_resources import *
-
 __all__ = [
     "load_resources",
 ] 
\ No newline at end of file
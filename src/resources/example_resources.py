@@ -5,306 +5,85 @@ This module demonstrates how to create MCP resources that provide
 templates, documents, and other content to MCP clients.
 """
 
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Tuple
+
 from fastmcp import FastMCP
-from typing import Dict, Any, List
 
-# Get the global FastMCP instance
-mcp = FastMCP("MCP Server Template")
+# Directory holding the resource bodies; each file is read on first request
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 
-@mcp.resource("template://readme")
-async def readme_template() -> str:
+@lru_cache(maxsize=None)
+def _load(name: str) -> str:
     """
-    Provide a README template for new projects.
+    Read a resource body from the templates directory, caching it after first use.
     
+    Args:
+        name: File name inside the templates directory
+        
     Returns:
-        String containing README template content
+        File content
     """
-    return """# Project Name
-
-## Description
-Brief description of your project.
-
-## Installation
-```bash
-pip install -r requirements.txt
-```
+    return (_TEMPLATES_DIR / name).read_text(encoding="utf-8")
 
-## Usage
-```python
-from your_project import main
-main()
-```
 
-## Contributing
-1. Fork the repository
-2. Create a feature branch
-3. Make your changes
-4. Submit a pull request
+# Resource template files by URI
+_RESOURCES: Dict[str, str] = {
+    "template://readme": "readme.txt",
+    "template://dockerfile": "dockerfile.txt",
+    "template://gitignore": "gitignore.txt",
+    "config://example": "example_config.txt",
+    "docs://api": "api_documentation.txt",
+}
 
-## License
-MIT License
-"""
+# Resource names and descriptions shown to MCP clients, by URI
+_RESOURCE_INFO: Dict[str, Tuple[str, str]] = {
+    "template://readme": ("readme_template", "Provide a README template for new projects."),
+    "template://dockerfile": ("dockerfile_template", "Provide a Dockerfile template."),
+    "template://gitignore": ("gitignore_template", "Provide a Python .gitignore template."),
+    "config://example": ("example_config", "Provide an example configuration file."),
+    "docs://api": ("api_documentation", "Provide API documentation."),
+}
 
 
-@mcp.resource("template://dockerfile")
-async def dockerfile_template() -> str:
+def _make_handler(filename: str) -> Callable[[], Awaitable[str]]:
     """
-    Provide a Dockerfile template.
+    Create a resource handler that serves a template file.
     
+    Args:
+        filename: Template file to serve
+        
     Returns:
-        String containing Dockerfile template content
+        Async handler returning the file content
     """
-    return """FROM python:3.11-slim
-
-WORKDIR /app
-
-COPY requirements.txt .
-RUN pip install -r requirements.txt
-
-COPY . .
-
-EXPOSE 8000
-
-CMD ["python", "main.py"]
-"""
-
-
-@mcp.resource("template://gitignore")
-async def gitignore_template() -> str:
-    """
-    Provide a Python .gitignore template.
+    async def handler() -> str:
+        return _load(filename)
     
-    Returns:
-        String containing .gitignore template content
-    """
-    return """# Byte-compiled / optimized / DLL files
-__pycache__/
-*.py[cod]
-*$py.class
-
-# C extensions
-*.so
-
-# Distribution / packaging
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-
-# PyInstaller
-*.manifest
-*.spec
-
-# Installer logs
-pip-log.txt
-pip-delete-this-directory.txt
-
-# Unit test / coverage reports
-htmlcov/
-.tox/
-.coverage
-.coverage.*
-.cache
-nosetests.xml
-coverage.xml
-*.cover
-.hypothesis/
-.pytest_cache/
-
-# Translations
-*.mo
-*.pot
-
-# Django stuff:
-*.log
-local_settings.py
-db.sqlite3
-
-# Flask stuff:
-instance/
-.webassets-cache
-
-# Scrapy stuff:
-.scrapy
-
-# Sphinx documentation
-docs/_build/
-
-# PyBuilder
-target/
-
-# Jupyter Notebook
-.ipynb_checkpoints
-
-# pyenv
-.python-version
-
-# celery beat schedule file
-celerybeat-schedule
-
-# SageMath parsed files
-*.sage.py
-
-# Environments
-.env
-.venv
-env/
-venv/
-ENV/
-env.bak/
-venv.bak/
+    return handler
 
-# Spyder project settings
-.spyderproject
-.spyproject
 
-# Rope project settings
-.ropeproject
-
-# mkdocs documentation
-/site
-
-# mypy
-.mypy_cache/
-.dmypy.json
-dmypy.json
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-
-# OS
-.DS_Store
-Thumbs.db
-"""
-
-
-@mcp.resource("config://example")
-async def example_config() -> str:
+def register(mcp: FastMCP) -> int:
     """
-    Provide an example configuration file.
+    Register the example resources with the server's MCP instance.
     
-    Returns:
-        String containing example configuration content
-    """
-    return """{
-  "server": {
-    "host": "localhost",
-    "port": 8000,
-    "debug": false
-  },
-  "database": {
-    "url": "sqlite:///app.db",
-    "echo": false
-  },
-  "logging": {
-    "level": "INFO",
-    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-  }
-}
-"""
-
-
-@mcp.resource("docs://api")
-async def api_documentation() -> str:
-    """
-    Provide API documentation.
+    Every resource is served through the same generic handler.
     
+    Args:
+        mcp: The FastMCP server instance
+        
     Returns:
-        String containing API documentation
+        Number of resources registered
     """
-    return """# API Documentation
-
-## Overview
-This API provides tools for data processing and analysis.
-
-## Authentication
-Include your API key in the header:
-```
-X-API-Key: your-api-key-here
-```
-
-## Endpoints
-
-### GET /tools
-List all available tools.
-
-**Response:**
-```json
-{
-  "tools": [
-    {
-      "name": "process_data",
-      "description": "Process data with various operations"
-    }
-  ]
-}
-```
-
-### POST /tools/{tool_name}
-Execute a specific tool.
-
-**Parameters:**
-- `tool_name`: Name of the tool to execute
-
-**Request Body:**
-```json
-{
-  "parameters": {
-    "data": "input data",
-    "operation": "transform"
-  }
-}
-```
-
-**Response:**
-```json
-{
-  "success": true,
-  "data": {
-    "result": "processed data"
-  },
-  "execution_time": 0.123
-}
-```
-
-## Error Handling
-All errors return a standardized format:
-
-```json
-{
-  "success": false,
-  "error": "Error description",
-  "error_code": "ERROR_CODE",
-  "details": {}
-}
-```
-
-## Rate Limiting
-API calls are limited to 1000 requests per hour per API key.
-"""
+    for uri, filename in _RESOURCES.items():
+        name, description = _RESOURCE_INFO[uri]
+        mcp.resource(uri, name=name, description=description)(_make_handler(filename))
+    
+    return len(_RESOURCES)
 
 
-# Export all resources for the module loader
+# Export the registration hook for the module loader
 __all__ = [
-    "readme_template",
-    "dockerfile_template", 
-    "gitignore_template",
-    "example_config",
-    "api_documentation"
-] 
\ No newline at end of file
+    "register",
+]
@@ -11,9 +11,16 @@ A robust, production-ready FastMCP server with comprehensive features:
 """
 
 import os
+import sys
+import json
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; FastMCP's default serializer is used
+    orjson = None
 
 from fastmcp import FastMCP
 from config.settings import settings
@@ -22,6 +29,19 @@ from resources import load_resources
 from prompts import load_prompts
 
 
+def _orjson_serializer(data: Any) -> str:
+    """Serialize a tool result to JSON text with orjson, falling back to the stdlib."""
+    try:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+        ).decode()
+    except TypeError:
+        # Values orjson cannot encode, e.g. integers outside the 64-bit range
+        return json.dumps(data, default=str)
+
+
 class MCPServerTemplate:
     """Main MCP Server class with lifecycle management."""
     
@@ -29,50 +49,65 @@ class MCPServerTemplate:
         """Initialize the MCP server."""
         self.mcp: Optional[FastMCP] = None
         self.is_initialized = False
+        self._banner: List[str] = []
         
     async def initialize(self) -> None:
         """Initialize server resources and components."""
-        print(f"🚀 Initializing {settings.SERVER_NAME} v{settings.SERVER_VERSION}")
+        self._banner.append(f"🚀 Initializing {settings.SERVER_NAME} v{settings.SERVER_VERSION}")
         
-        # Create FastMCP instance
-        self.mcp = FastMCP(settings.SERVER_NAME)
-        
-        # Load all components
-        await self._load_components()
-        
-        # Initialize monitoring and health checks
-        if settings.ENABLE_HEALTH_CHECK:
-            await self._setup_health_monitoring()
+        try:
+            # Create FastMCP instance
+            self.mcp = FastMCP(
+                settings.SERVER_NAME,
+                tool_serializer=_orjson_serializer if orjson is not None else None
+            )
+            
+            # Load all components
+            await self._load_components()
             
-        # Initialize metrics collection
-        if settings.ENABLE_METRICS:
-            await self._setup_metrics()
+            # Initialize monitoring and health checks
+            if settings.ENABLE_HEALTH_CHECK:
+                await self._setup_health_monitoring()
+                
+            # Initialize metrics collection
+            if settings.ENABLE_METRICS:
+                await self._setup_metrics()
+                
+            self.is_initialized = True
+            self._banner.append(f"✅ {settings.SERVER_NAME} initialized successfully")
             
-        self.is_initialized = True
-        print(f"✅ {settings.SERVER_NAME} initialized successfully")
+        finally:
+            self._flush_banner()
+            
+    def _flush_banner(self) -> None:
+        """Write the buffered startup messages in a single write."""
+        if self._banner:
+            sys.stdout.write("\n".join(self._banner) + "\n")
+            sys.stdout.flush()
+            self._banner.clear()
         
     async def _load_components(self) -> None:
         """Load tools, resources, and prompts."""
         try:
-            # Load tools
-            tools_count = await load_tools(self.mcp)
-            print(f"📊 Loaded {tools_count} tools")
-            
-            # Load resources
-            resources_count = await load_resources(self.mcp)
-            print(f"📚 Loaded {resources_count} resources")
-            
-            # Load prompts
-            prompts_count = await load_prompts(self.mcp)
-            print(f"💬 Loaded {prompts_count} prompts")
+            # The loaders are independent, so overlap their imports
+            tools_count, resources_count, prompts_count = await asyncio.gather(
+                load_tools(self.mcp),
+                load_resources(self.mcp),
+                load_prompts(self.mcp),
+            )
+            self._banner += (
+                f"📊 Loaded {tools_count} tools",
+                f"📚 Loaded {resources_count} resources",
+                f"💬 Loaded {prompts_count} prompts",
+            )
             
         except Exception as e:
-            print(f"❌ Error loading components: {e}")
+            self._banner.append(f"❌ Error loading components: {e}")
             raise
             
     async def _setup_health_monitoring(self) -> None:
         """Setup health check endpoints and monitoring."""
-        print("📊 Setting up health monitoring...")
+        self._banner.append("📊 Setting up health monitoring...")
         
         @self.mcp.tool
         async def health_check() -> Dict[str, Any]:
@@ -87,7 +122,7 @@ class MCPServerTemplate:
             
     async def _setup_metrics(self) -> None:
         """Setup metrics collection."""
-        print("📈 Setting up metrics collection...")
+        self._banner.append("📈 Setting up metrics collection...")
         # Implement metrics collection logic here
         pass
         
@@ -127,43 +162,52 @@ def create_server() -> FastMCP:
     This function is used for testing and manual server creation.
     """
     if not server_instance.is_initialized:
-        # For synchronous contexts, we need to run initialization
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(server_instance.initialize())
+        # For synchronous contexts, run initialization on a short-lived loop
+        asyncio.run(server_instance.initialize())
         
     return server_instance.mcp
 
 
+async def _async_main() -> None:
+    """Initialize the server and serve stdio on a single event loop."""
+    await server_instance.initialize()
+    await server_instance.mcp.run_async(transport="stdio")
+
+
 def main():
     """Main entry point for the MCP server."""
-    print(f"🌐 Starting {settings.SERVER_NAME} on {settings.HOST}:{settings.PORT}")
-    print(f"📡 Transport: {settings.TRANSPORT}")
-    print(f"🔗 Endpoint: http://{settings.HOST}:{settings.PORT}/mcp")
-    print(f"📋 Description: {settings.SERVER_DESCRIPTION}")
+    server_instance._banner += (
+        f"🌐 Starting {settings.SERVER_NAME} on {settings.HOST}:{settings.PORT}",
+        f"📡 Transport: {settings.TRANSPORT}",
+        f"🔗 Endpoint: http://{settings.HOST}:{settings.PORT}/mcp",
+        f"📋 Description: {settings.SERVER_DESCRIPTION}",
+    )
+    
+    transport = settings.TRANSPORT.lower()
+    
+    # stdio can initialize and serve on the same loop
+    if transport not in ("http", "sse"):
+        asyncio.run(_async_main())
+        return
     
-    # Initialize server synchronously
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(server_instance.initialize())
+    # Initialize server synchronously; the transport owns the runtime loop
+    asyncio.run(server_instance.initialize())
     
     # Run with specified transport
-    if settings.TRANSPORT.lower() == "http":
+    if transport == "http":
         server_instance.mcp.run(
             transport="http",
             host=settings.HOST,
             port=settings.PORT,
             path="/mcp"
         )
-    elif settings.TRANSPORT.lower() == "sse":
+    else:  # sse
         server_instance.mcp.run(
             transport="sse",
             host=settings.HOST,
             port=settings.PORT,
             path="/sse"
         )
-    else:  # stdio
-        server_instance.mcp.run(transport="stdio")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ Add your tool implementations to this package and register them here.
 
 import importlib
 import logging
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,8 +20,9 @@ async def load_tools(mcp: "FastMCP") -> int:
     """
     Load all tools into the MCP server.
     
-    This function dynamically imports and registers all tool modules.
-    Add new tool modules to the TOOL_MODULES list below.
+    This function dynamically imports all tool modules and calls each
+    module's ``register(mcp)`` hook. Add new tool modules to the
+    TOOL_MODULES list below.
     
     Args:
         mcp: The FastMCP server instance
@@ -44,12 +46,11 @@ async def load_tools(mcp: "FastMCP") -> int:
         try:
             logger.debug(f"Loading tool module: {module_name}")
             
-            # Import the module - this will register its tools with the MCP instance
-            importlib.import_module(module_name)
-            
-            # Count would be handled by the tool decorators in each module
-            # For now, we'll assume each module adds at least one tool
-            tools_loaded += 1
+            # Reuse an already-imported module (reloads, test harnesses) before
+            # falling back to the import machinery, then register its tools
+            # with the server's MCP instance
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+            tools_loaded += module.register(mcp)
             
             logger.debug(f"Successfully loaded tool module: {module_name}")
             
@@ -59,7 +60,7 @@ async def load_tools(mcp: "FastMCP") -> int:
             logger.error(f"Error loading tool module {module_name}: {e}")
             # Don't raise here - we want to continue loading other modules
     
-    logger.info(f"Loaded {tools_loaded} tool modules")
+    logger.info(f"Loaded {tools_loaded} tools")
     return tools_loaded
 
 
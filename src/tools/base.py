@@ -8,14 +8,12 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, TypeVar, Generic
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar('T')
-
 
 class ToolError(Exception):
     """Base exception for tool-related errors."""
@@ -36,12 +34,12 @@ class ToolError(Exception):
         }
 
 
-@dataclass
-class ToolResult(Generic[T]):
+@dataclass(slots=True)
+class ToolResult:
     """Standardized tool result format."""
     
     success: bool
-    data: Optional[T] = None
+    data: Optional[Any] = None
     error: Optional[str] = None
     error_code: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
@@ -106,7 +104,7 @@ class BaseTool(ABC):
         
         This wrapper handles common concerns like timing, error handling, and logging.
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             self.logger.debug(f"Executing tool {self.name} with args: {kwargs}")
@@ -118,14 +116,14 @@ class BaseTool(ABC):
             result = await self.execute(**kwargs)
             
             # Add execution time
-            result.execution_time = time.time() - start_time
+            result.execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             
             self.logger.debug(f"Tool {self.name} completed in {result.execution_time:.3f}s")
             
             return result.to_dict()
             
         except ToolError as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             self.logger.error(f"Tool {self.name} failed: {e.message}")
             
             return ToolResult(
@@ -137,7 +135,7 @@ class BaseTool(ABC):
             ).to_dict()
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             self.logger.exception(f"Unexpected error in tool {self.name}")
             
             return ToolResult(
@@ -195,20 +193,24 @@ def tool_retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
+            # Fast path: the first attempt runs outside the retry loop
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                last_exception = e
+            
             current_delay = delay
             
-            for attempt in range(max_attempts):
+            for attempt in range(1, max_attempts):
+                logger.warning(f"Tool attempt {attempt} failed, retrying in {current_delay}s: {last_exception}")
+                await asyncio.sleep(current_delay)
+                current_delay *= backoff
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(f"Tool attempt {attempt + 1} failed, retrying in {current_delay}s: {e}")
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(f"Tool failed after {max_attempts} attempts")
+            
+            logger.error(f"Tool failed after {max_attempts} attempts")
             
             # Re-raise the last exception
             raise last_exception
@@ -238,6 +240,71 @@ def validate_required_params(*required_params):
     return decorator
 
 
+def tool_guard(
+    *,
+    timeout: Optional[float] = None,
+    retries: int = 1,
+    delay: float = 0.0,
+    backoff: float = 1.0,
+    required: Tuple[str, ...] = ()
+):
+    """
+    Decorator combining parameter validation, timeout and retry in one wrapper.
+    
+    Behaves like stacking validate_required_params, tool_retry and tool_timeout
+    (outermost first), but runs them in a single wrapper frame per call.
+    
+    Args:
+        timeout: Timeout per attempt in seconds (None disables the timeout)
+        retries: Maximum number of attempts
+        delay: Initial delay between retries (seconds)
+        backoff: Backoff multiplier for delay
+        required: Names of required keyword parameters
+    
+    Raises:
+        ValueError: If retries is less than 1
+    """
+    if retries < 1:
+        raise ValueError(f"retries must be at least 1, got {retries}")
+    
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if required:
+                missing_params = [param for param in required if param not in kwargs]
+                if missing_params:
+                    raise ToolError(
+                        f"Missing required parameters: {', '.join(missing_params)}",
+                        error_code="MISSING_PARAMETERS",
+                        details={"missing_parameters": missing_params}
+                    )
+            
+            current_delay = delay
+            
+            for attempt in range(retries):
+                try:
+                    if timeout is None:
+                        return await func(*args, **kwargs)
+                    try:
+                        async with asyncio.timeout(timeout):
+                            return await func(*args, **kwargs)
+                    except TimeoutError:
+                        raise ToolError(
+                            f"Tool execution timed out after {timeout} seconds",
+                            error_code="TIMEOUT_ERROR"
+                        ) from None
+                except Exception as e:
+                    if attempt == retries - 1:
+                        if retries > 1:
+                            logger.error(f"Tool failed after {retries} attempts")
+                        raise
+                    logger.warning(f"Tool attempt {attempt + 1} failed, retrying in {current_delay}s: {e}")
+                    await asyncio.sleep(current_delay)
+                    current_delay *= backoff
+        return wrapper
+    return decorator
+
+
 # Utility functions for common tool patterns
 
 async def safe_execute(coro, default_value=None, error_message="Operation failed"):
@@ -259,6 +326,10 @@ async def safe_execute(coro, default_value=None, error_message="Operation failed
         return default_value
 
 
+# Key order of every success response; copied rather than rebuilt per call
+_SUCCESS_TEMPLATE: Dict[str, Any] = {"success": True, "message": "", "data": None, "metadata": None}
+
+
 def format_success_response(data: Any, message: str = "Operation completed successfully", **metadata) -> Dict[str, Any]:
     """
     Format a successful tool response.
@@ -271,12 +342,11 @@ def format_success_response(data: Any, message: str = "Operation completed succe
     Returns:
         Formatted response dictionary
     """
-    return {
-        "success": True,
-        "message": message,
-        "data": data,
-        "metadata": metadata
-    }
+    response = _SUCCESS_TEMPLATE.copy()
+    response["message"] = message
+    response["data"] = data
+    response["metadata"] = metadata
+    return response
 
 
 def format_error_response(error: str, error_code: str = "ERROR", **details) -> Dict[str, Any]:
@@ -12,27 +12,209 @@ This module demonstrates various patterns for creating MCP tools:
 import asyncio
 import json
 import random
+import re
+import shutil
+import sys
 import time
-from typing import Dict, Any, List, Optional
+import zoneinfo
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; statistics fall back to pure Python
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON handling falls back to the stdlib
+    orjson = None
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; system_health_check reports it missing
+    psutil = None
+else:
+    # Prime the CPU counter so non-blocking samples have a baseline
+    psutil.cpu_percent(interval=None)
+
 from fastmcp import FastMCP
 from .base import (
     BaseTool, ToolResult, ToolError,
-    tool_timeout, tool_retry, validate_required_params,
+    tool_guard,
     format_success_response, format_error_response
 )
 
-# Get the global FastMCP instance
-# In your actual implementation, you'll need to manage this properly
-mcp = FastMCP("MCP Server Template")
+# =============================================================================
+# Helpers
+# =============================================================================
+
+# Private generator for simulated failures, kept off the shared global state
+_rng = random.Random()
+
+# Last system_health_check samples as (monotonic time, (cpu_percent, memory,
+# disk, check_time)); responses are rebuilt from them so callers never share
+# a mutable dict
+_HEALTH_CACHE: Optional[Tuple[float, Tuple[Any, ...]]] = None
+_HEALTH_TTL = 2.0  # seconds health samples are reused
+
+# Tools collected at import time and handed to FastMCP in register()
+_TOOLS: List[Callable[..., Any]] = []
+
+
+def _collect(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Add a tool function to the module's registry table."""
+    _TOOLS.append(fn)
+    return fn
+
+
+@lru_cache(maxsize=128)
+def _get_tz(name: str) -> zoneinfo.ZoneInfo:
+    """Resolve a timezone by name, caching the parsed tzdata."""
+    return zoneinfo.ZoneInfo(name)
+
+
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(_UTC).isoformat()
+
+
+@lru_cache(maxsize=4)
+def _iso_for_second(sec: int) -> str:
+    """Format a UTC timestamp for the given epoch second, cached per second."""
+    return datetime.fromtimestamp(sec, tz=_UTC).isoformat()
+
+
+# Digit runs long enough to hold an integer outside orjson's 64-bit range
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+
+def _json_loads(json_string: str) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        json_string: JSON string to parse
+        
+    Returns:
+        The parsed Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    # orjson has no parser object to pool: state that is worth reusing
+    # between calls (its object key cache) is kept inside the library.
+    # It turns integers outside the 64-bit range into floats, so documents
+    # with long digit runs stay on the stdlib parser, which keeps them exact.
+    if orjson is not None and _LONG_DIGITS.search(json_string) is None:
+        try:
+            return orjson.loads(json_string)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (NaN, Infinity, lone
+            # surrogates); let json decide and report the error
+            pass
+    return json.loads(json_string)
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """Serialize an object as two-space indented JSON."""
+    # Stays on the stdlib: orjson would write NaN/Infinity as null and stop
+    # escaping non-ASCII text, changing the report content
+    return json.dumps(obj, indent=2)
+
+
+# Integers up to this magnitude are exact as float64, so int arrays whose
+# sum stays within it give the same results as the pure Python path
+_FLOAT64_EXACT_INT = 2 ** 53
+
+
+def _numeric_array(numbers: List[Any]) -> Optional["np.ndarray"]:
+    """
+    Convert numbers to an array NumPy can reduce without changing results.
+    
+    Args:
+        numbers: Items to analyze
+        
+    Returns:
+        A float64 or int64 array, or None when the items need the pure Python
+        path (bools, integers too wide for exact float64 sums, object arrays)
+        
+    Raises:
+        ToolError: If the items are nested or not numbers
+    """
+    try:
+        arr = np.asarray(numbers)
+    except ValueError:
+        # Ragged nesting such as [1, [2]]
+        raise ToolError("All items must be numbers", "INVALID_TYPE")
+    
+    if arr.ndim != 1:
+        raise ToolError("All items must be numbers", "INVALID_TYPE")
+    
+    if arr.dtype == np.float64:
+        return arr
+    
+    if arr.dtype == np.int64:
+        magnitude = max(-int(arr.min()), int(arr.max()))
+        if magnitude * arr.size <= _FLOAT64_EXACT_INT:
+            return arr
+        return None
+    
+    if arr.dtype.kind in "buO":
+        # Validated item by item and computed with Python ints
+        return None
+    
+    raise ToolError("All items must be numbers", "INVALID_TYPE")
+
+
+def _numpy_statistics(arr: "np.ndarray", precision: int) -> Dict[str, Any]:
+    """
+    Calculate statistics with vectorized NumPy reductions.
+    
+    Args:
+        arr: Array returned by _numeric_array
+        precision: Decimal precision for results
+        
+    Returns:
+        Dict of statistics, matching the pure Python implementation
+    """
+    values = arr.astype(np.float64, copy=False)
+    count = int(arr.size)
+    mid = count // 2
+    
+    if arr.dtype == np.int64:
+        # Keep integral results as Python ints, like sum() and sorted() do
+        total = int(arr.sum())
+        if count % 2:
+            median = np.partition(arr, mid)[mid].item()
+        else:
+            median = float(np.median(values))
+    else:
+        total = float(values.sum())
+        median = float(np.median(values))
+    
+    return {
+        "count": count,
+        "sum": round(total, precision),
+        "mean": round(total / count, precision),
+        "median": round(median, precision),
+        "min": arr.min().item(),
+        "max": arr.max().item(),
+        "std_dev": round(float(values.std()), precision),
+        "variance": round(float(values.var()), precision)
+    }
 
 
 # =============================================================================
 # Simple Tools
 # =============================================================================
 
-@mcp.tool
+@_collect
 async def echo(message: str) -> Dict[str, Any]:
     """
     Echo a message back to the caller.
@@ -48,12 +230,12 @@ async def echo(message: str) -> Dict[str, Any]:
     return format_success_response(
         data={"echoed_message": message},
         message="Message echoed successfully",
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=_iso_for_second(int(time.time())),
         tool_name="echo"
     )
 
 
-@mcp.tool
+@_collect
 async def get_current_time(timezone_name: str = "UTC") -> Dict[str, Any]:
     """
     Get the current time in the specified timezone.
@@ -65,8 +247,7 @@ async def get_current_time(timezone_name: str = "UTC") -> Dict[str, Any]:
         Dict containing current time information
     """
     try:
-        import zoneinfo
-        tz = zoneinfo.ZoneInfo(timezone_name)
+        tz = _get_tz(timezone_name)
         current_time = datetime.now(tz)
         
         return format_success_response(
@@ -91,8 +272,8 @@ async def get_current_time(timezone_name: str = "UTC") -> Dict[str, Any]:
 # Tools with Validation
 # =============================================================================
 
-@mcp.tool
-@validate_required_params("numbers")
+@_collect
+@tool_guard(required=("numbers",))
 async def calculate_statistics(numbers: List[float], precision: int = 2) -> Dict[str, Any]:
     """
     Calculate basic statistics for a list of numbers.
@@ -110,15 +291,41 @@ async def calculate_statistics(numbers: List[float], precision: int = 2) -> Dict
         if not numbers:
             raise ToolError("Numbers list cannot be empty", "EMPTY_LIST")
         
-        if not all(isinstance(n, (int, float)) for n in numbers):
-            raise ToolError("All items must be numbers", "INVALID_TYPE")
+        arr = _numeric_array(numbers) if np is not None else None
         
         if precision < 0 or precision > 10:
             raise ToolError("Precision must be between 0 and 10", "INVALID_PRECISION")
         
-        # Calculate statistics
-        count = len(numbers)
-        total = sum(numbers)
+        if arr is not None:
+            return format_success_response(
+                data=_numpy_statistics(arr, precision),
+                message="Statistics calculated successfully",
+                precision=precision
+            )
+        
+        # Calculate statistics in one pass: validate types, track sum/min/max and
+        # use Welford's algorithm for the running mean and squared deviations
+        count = 0
+        total = 0
+        running_mean = 0.0
+        m2 = 0.0
+        minimum = maximum = numbers[0]
+        
+        for x in numbers:
+            if not isinstance(x, (int, float)):
+                raise ToolError("All items must be numbers", "INVALID_TYPE")
+            
+            count += 1
+            total += x
+            delta = x - running_mean
+            running_mean += delta / count
+            m2 += delta * (x - running_mean)
+            
+            if x < minimum:
+                minimum = x
+            elif x > maximum:
+                maximum = x
+        
         mean = total / count
         sorted_nums = sorted(numbers)
         
@@ -130,7 +337,7 @@ async def calculate_statistics(numbers: List[float], precision: int = 2) -> Dict
             median = sorted_nums[mid]
         
         # Standard deviation
-        variance = sum((x - mean) ** 2 for x in numbers) / count
+        variance = m2 / count
         std_dev = variance ** 0.5
         
         stats = {
@@ -138,8 +345,8 @@ async def calculate_statistics(numbers: List[float], precision: int = 2) -> Dict
             "sum": round(total, precision),
             "mean": round(mean, precision),
             "median": round(median, precision),
-            "min": min(numbers),
-            "max": max(numbers),
+            "min": minimum,
+            "max": maximum,
             "std_dev": round(std_dev, precision),
             "variance": round(variance, precision)
         }
@@ -160,8 +367,8 @@ async def calculate_statistics(numbers: List[float], precision: int = 2) -> Dict
 # Async Tools with Timeout
 # =============================================================================
 
-@mcp.tool
-@tool_timeout(10)  # 10 second timeout
+@_collect
+@tool_guard(timeout=10)  # 10 second timeout
 async def simulate_async_work(
     duration: float = 1.0, 
     should_fail: bool = False,
@@ -186,7 +393,7 @@ async def simulate_async_work(
     if duration > 30:
         raise ToolError("Duration too long (max 30 seconds)", "DURATION_TOO_LONG")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Simulate work
     await asyncio.sleep(duration)
@@ -194,14 +401,14 @@ async def simulate_async_work(
     if should_fail:
         raise ToolError("Simulated failure occurred", "SIMULATED_FAILURE")
     
-    execution_time = time.time() - start_time
+    execution_time = time.perf_counter() - start_time
     
     return format_success_response(
         data={
             "result": return_data,
             "requested_duration": duration,
             "actual_duration": round(execution_time, 3),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _iso_for_second(int(time.time()))
         },
         message="Async work completed successfully"
     )
@@ -211,8 +418,8 @@ async def simulate_async_work(
 # Tools with Retry Logic
 # =============================================================================
 
-@mcp.tool
-@tool_retry(max_attempts=3, delay=0.5, backoff=2.0)
+@_collect
+@tool_guard(retries=3, delay=0.5, backoff=2.0)
 async def unreliable_operation(
     success_rate: float = 0.7,
     data: str = "operation result"
@@ -233,14 +440,14 @@ async def unreliable_operation(
         raise ToolError("Success rate must be between 0.0 and 1.0", "INVALID_RATE")
     
     # Simulate random failure
-    if random.random() > success_rate:
+    if _rng.random() > success_rate:
         raise ToolError("Random failure occurred", "RANDOM_FAILURE")
     
     return format_success_response(
         data={"result": data},
         message="Unreliable operation succeeded",
         success_rate=success_rate,
-        attempt_time=datetime.now(timezone.utc).isoformat()
+        attempt_time=_iso_for_second(int(time.time()))
     )
 
 
@@ -248,7 +455,89 @@ async def unreliable_operation(
 # Complex Data Processing Tools
 # =============================================================================
 
-@mcp.tool
+def _op_validate(data: Any, json_string: str, filter_key: Optional[str], sort_by: Optional[str]) -> Dict[str, Any]:
+    """Describe the parsed document."""
+    return {
+        "validation": {
+            "valid": True,
+            "type": type(data).__name__,
+            "size": len(json_string)
+        }
+    }
+
+
+def _op_filter(data: Any, json_string: str, filter_key: Optional[str], sort_by: Optional[str]) -> Dict[str, Any]:
+    """Keep the objects of an array that contain filter_key."""
+    if not filter_key:
+        raise ToolError("Unknown operation: filter", "UNKNOWN_OPERATION")
+    
+    if not isinstance(data, list):
+        raise ToolError("Filtering requires array data", "INVALID_DATA_TYPE")
+    
+    # Parsed JSON objects are always exact dicts
+    filtered = [item for item in data if type(item) is dict and filter_key in item]
+    return {
+        "filtered_data": filtered,
+        "filter_stats": {"original_count": len(data), "filtered_count": len(filtered)}
+    }
+
+
+def _op_sort(data: Any, json_string: str, filter_key: Optional[str], sort_by: Optional[str]) -> Dict[str, Any]:
+    """Sort an array of objects by sort_by."""
+    if not sort_by:
+        raise ToolError("Unknown operation: sort", "UNKNOWN_OPERATION")
+    
+    # Only the first row is checked up front; non-object rows further in make
+    # the key lookups fail and are reported from the except branch instead of
+    # costing every valid input a preflight scan
+    if not isinstance(data, list) or (data and not isinstance(data[0], dict)):
+        raise ToolError("Sorting requires array of objects", "INVALID_DATA_TYPE")
+    
+    def default_key(item: Dict[str, Any]) -> Any:
+        return item.get(sort_by, "")
+    
+    try:
+        # itemgetter runs in C; sorted() computes every key before comparing,
+        # so a missing key fails fast and only then is the defaulting key used
+        try:
+            sorted_data = sorted(data, key=itemgetter(sort_by))
+        except KeyError:
+            sorted_data = sorted(data, key=default_key)
+    except Exception as e:
+        if not all(isinstance(item, dict) for item in data):
+            raise ToolError("Sorting requires array of objects", "INVALID_DATA_TYPE")
+        raise ToolError(f"Sort failed: {str(e)}", "SORT_ERROR")
+    
+    return {"sorted_data": sorted_data, "sort_key": sort_by}
+
+
+def _op_transform(data: Any, json_string: str, filter_key: Optional[str], sort_by: Optional[str]) -> Dict[str, Any]:
+    """Uppercase string values (simple transformation example)."""
+    # str.upper() has an ASCII fast path; pre-checks such as skipping
+    # digit-only strings cost more per value than the call they avoid
+    if isinstance(data, dict):
+        transformed = {k: v.upper() if type(v) is str else v for k, v in data.items()}
+    elif isinstance(data, list):
+        transformed = [item.upper() if type(item) is str else item for item in data]
+    else:
+        transformed = str(data).upper()
+    
+    return {"transformed_data": transformed}
+
+
+# Operation name -> handler returning the entries added to the result
+_JSON_OPERATIONS: Dict[str, Callable[[Any, str, Optional[str], Optional[str]], Dict[str, Any]]] = {
+    "validate": _op_validate,
+    "filter": _op_filter,
+    "sort": _op_sort,
+    "transform": _op_transform,
+}
+
+_REPORT_FORMATS = frozenset(("json", "text", "markdown"))
+_TEXT_SEP = "-" * 50  # rule under the header of text reports
+
+
+@_collect
 async def process_json_data(
     json_string: str,
     operation: str = "validate",
@@ -272,52 +561,20 @@ async def process_json_data(
     try:
         # Parse JSON
         try:
-            data = json.loads(json_string)
+            data = _json_loads(json_string)
         except json.JSONDecodeError as e:
             raise ToolError(f"Invalid JSON: {str(e)}", "INVALID_JSON")
         
-        result = {"original_data": data}
-        
-        if operation == "validate":
-            result["validation"] = {
-                "valid": True,
-                "type": type(data).__name__,
-                "size": len(str(data))
-            }
-            
-        elif operation == "filter" and filter_key:
-            if isinstance(data, list):
-                filtered = [item for item in data if isinstance(item, dict) and filter_key in item]
-                result["filtered_data"] = filtered
-                result["filter_stats"] = {"original_count": len(data), "filtered_count": len(filtered)}
-            else:
-                raise ToolError("Filtering requires array data", "INVALID_DATA_TYPE")
-                
-        elif operation == "sort" and sort_by:
-            if isinstance(data, list) and all(isinstance(item, dict) for item in data):
-                try:
-                    sorted_data = sorted(data, key=lambda x: x.get(sort_by, ""))
-                    result["sorted_data"] = sorted_data
-                    result["sort_key"] = sort_by
-                except Exception as e:
-                    raise ToolError(f"Sort failed: {str(e)}", "SORT_ERROR")
-            else:
-                raise ToolError("Sorting requires array of objects", "INVALID_DATA_TYPE")
-                
-        elif operation == "transform":
-            # Simple transformation example
-            if isinstance(data, dict):
-                transformed = {k: str(v).upper() if isinstance(v, str) else v for k, v in data.items()}
-                result["transformed_data"] = transformed
-            elif isinstance(data, list):
-                transformed = [str(item).upper() if isinstance(item, str) else item for item in data]
-                result["transformed_data"] = transformed
-            else:
-                result["transformed_data"] = str(data).upper()
-                
-        else:
+        handler = _JSON_OPERATIONS.get(operation)
+        if handler is None:
             raise ToolError(f"Unknown operation: {operation}", "UNKNOWN_OPERATION")
         
+        # The response echoes the whole document, so it is materialized once
+        # here; filter and sort results reference the same row objects
+        # rather than decoding or copying them again
+        result = {"original_data": data}
+        result.update(handler(data, json_string, filter_key, sort_by))
+        
         return format_success_response(
             data=result,
             message=f"JSON {operation} completed successfully",
@@ -334,7 +591,7 @@ async def process_json_data(
 # File-like Operations (simulated)
 # =============================================================================
 
-@mcp.tool
+@_collect
 async def generate_report(
     title: str,
     data: Dict[str, Any],
@@ -358,35 +615,28 @@ async def generate_report(
     if not title.strip():
         raise ToolError("Title cannot be empty", "EMPTY_TITLE")
     
-    if format_type not in ["json", "text", "markdown"]:
+    if format_type not in _REPORT_FORMATS:
         raise ToolError("Format must be json, text, or markdown", "INVALID_FORMAT")
     
-    timestamp = datetime.now(timezone.utc).isoformat() if include_timestamp else None
+    timestamp = _now_iso() if include_timestamp else None
     
+    # Each format serializes the data exactly once, straight into the final
+    # layout, so large reports hold no extra re-indented copies in memory
     if format_type == "json":
-        report = {
+        content = _json_dumps_pretty({
             "title": title,
             "data": data,
             "generated_at": timestamp,
             "format": "json"
-        }
-        content = json.dumps(report, indent=2)
+        })
         
     elif format_type == "text":
-        lines = [f"Report: {title}"]
-        if timestamp:
-            lines.append(f"Generated: {timestamp}")
-        lines.append("-" * 50)
-        lines.append(f"Data: {json.dumps(data, indent=2)}")
-        content = "\n".join(lines)
+        ts = f"Generated: {timestamp}\n" if timestamp else ""
+        content = f"Report: {title}\n{ts}{_TEXT_SEP}\nData: {_json_dumps_pretty(data)}"
         
     elif format_type == "markdown":
-        lines = [f"# {title}"]
-        if timestamp:
-            lines.append(f"*Generated: {timestamp}*")
-        lines.append("\n## Data\n")
-        lines.append(f"```json\n{json.dumps(data, indent=2)}\n```")
-        content = "\n".join(lines)
+        ts = f"*Generated: {timestamp}*\n" if timestamp else ""
+        content = f"# {title}\n{ts}\n## Data\n\n```json\n{_json_dumps_pretty(data)}\n```"
     
     return format_success_response(
         data={
@@ -404,7 +654,7 @@ async def generate_report(
 # Health and Monitoring Tools
 # =============================================================================
 
-@mcp.tool
+@_collect
 async def system_health_check() -> Dict[str, Any]:
     """
     Perform a basic system health check.
@@ -414,14 +664,31 @@ async def system_health_check() -> Dict[str, Any]:
     Returns:
         Dict containing system health information
     """
-    import sys
-    import psutil
+    global _HEALTH_CACHE
+    
+    # Reuse recent samples while they are fresh
+    now = time.monotonic()
+    cached = _HEALTH_CACHE
+    if cached is not None and now - cached[0] >= _HEALTH_TTL:
+        cached = None
+    
+    if psutil is None:
+        return format_error_response(
+            error="psutil not available - install it for system monitoring",
+            error_code="DEPENDENCY_MISSING",
+            suggestion="pip install psutil"
+        )
     
     try:
-        # Get system information
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        if cached is not None:
+            cpu_percent, memory, disk, check_time = cached[1]
+        else:
+            # Get system information (CPU usage since the previous sample)
+            cpu_percent = psutil.cpu_percent(interval=None)
+            memory = psutil.virtual_memory()
+            disk = shutil.disk_usage('/')  # one statvfs call
+            check_time = _now_iso()
+            _HEALTH_CACHE = (now, (cpu_percent, memory, disk, check_time))
         
         health_data = {
             "python_version": sys.version,
@@ -442,19 +709,33 @@ async def system_health_check() -> Dict[str, Any]:
         return format_success_response(
             data=health_data,
             message="Health check completed",
-            check_time=datetime.now(timezone.utc).isoformat()
+            check_time=check_time
         )
         
-    except ImportError:
-        return format_error_response(
-            error="psutil not available - install it for system monitoring",
-            error_code="DEPENDENCY_MISSING",
-            suggestion="pip install psutil"
-        )
     except Exception as e:
         raise ToolError(f"Health check failed: {str(e)}", "HEALTH_CHECK_ERROR")
 
 
+# =============================================================================
+# Registration
+# =============================================================================
+
+def register(mcp: FastMCP) -> int:
+    """
+    Register the example tools with the server's MCP instance.
+    
+    Args:
+        mcp: The FastMCP server instance
+        
+    Returns:
+        Number of tools registered
+    """
+    for tool in _TOOLS:
+        mcp.tool(tool)
+    
+    return len(_TOOLS)
+
+
 # Export all tools for the module loader
 __all__ = [
     "echo",
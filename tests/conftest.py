@@ -4,8 +4,9 @@ Test configuration and fixtures for MCP Server Template.
 This module provides common fixtures and configuration for the test suite.
 """
 
-import asyncio
 import pytest
+import pytest_asyncio
+from types import MappingProxyType, SimpleNamespace
 from typing import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock
 
@@ -13,18 +14,10 @@ from fastmcp import FastMCP, Client
 from src.server import MCPServerTemplate
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session")
 async def server_instance() -> AsyncGenerator[MCPServerTemplate, None]:
     """
-    Create a test MCP server instance.
+    Create a test MCP server instance, shared by the whole session.
     
     Yields:
         Initialized MCP server instance
@@ -65,23 +58,24 @@ def mock_settings():
     Mock settings for testing.
     
     Returns:
-        Mock settings object
-    """
-    mock = MagicMock()
-    mock.SERVER_NAME = "Test MCP Server"
-    mock.SERVER_VERSION = "1.0.0-test"
-    mock.SERVER_DESCRIPTION = "Test server"
-    mock.HOST = "localhost"
-    mock.PORT = 8000
-    mock.TRANSPORT = "http"
-    mock.ENABLE_HEALTH_CHECK = True
-    mock.ENABLE_METRICS = False
-    mock.LOG_LEVEL = "DEBUG"
-    mock.DEBUG = True
-    mock.ENVIRONMENT = "testing"
-    mock.is_development = True
-    mock.is_production = False
-    return mock
+        Read-only settings namespace (use a local MagicMock where call
+        assertions are needed)
+    """
+    return SimpleNamespace(
+        SERVER_NAME="Test MCP Server",
+        SERVER_VERSION="1.0.0-test",
+        SERVER_DESCRIPTION="Test server",
+        HOST="localhost",
+        PORT=8000,
+        TRANSPORT="http",
+        ENABLE_HEALTH_CHECK=True,
+        ENABLE_METRICS=False,
+        LOG_LEVEL="DEBUG",
+        DEBUG=True,
+        ENVIRONMENT="testing",
+        is_development=True,
+        is_production=False,
+    )
 
 
 @pytest.fixture
@@ -101,24 +95,30 @@ def mock_httpx_client():
     return mock_client
 
 
-@pytest.fixture
+# Built once per session behind a read-only view; the nested values stay plain
+# JSON-serializable data so they can be passed straight to the tools
+_SAMPLE_DATA = MappingProxyType({
+    "numbers": (1, 2, 3, 4, 5),
+    "json_string": '{"name": "test", "value": 42}',
+    "text_data": "Hello, World!",
+    "config_data": {
+        "setting1": "value1",
+        "setting2": 123,
+        "setting3": True
+    }
+})
+
+
+@pytest.fixture(scope="session")
 def sample_test_data():
     """
     Sample test data for various test scenarios.
     
     Returns:
-        Dictionary containing test data
-    """
-    return {
-        "numbers": [1, 2, 3, 4, 5],
-        "json_string": '{"name": "test", "value": 42}',
-        "text_data": "Hello, World!",
-        "config_data": {
-            "setting1": "value1",
-            "setting2": 123,
-            "setting3": True
-        }
-    }
+        Read-only mapping containing test data (config_data is shared by
+        the session, so copy it with dict(...) before modifying it)
+    """
+    return _SAMPLE_DATA
 
 
 @pytest.fixture
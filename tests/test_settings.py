@@ -0,0 +1,98 @@
+"""
+Tests for the Settings dataclass.
+
+Covers keyword and subclass overrides and the values derived from them in
+__post_init__.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.config.settings import Settings
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestKeywordOverrides:
+    """Overrides passed to the constructor."""
+
+    def test_require_auth_derived_from_api_key(self):
+        assert Settings(API_KEY="secret").REQUIRE_AUTH is True
+        assert Settings(API_KEY=None).REQUIRE_AUTH is False
+
+    def test_explicit_require_auth_wins(self):
+        assert Settings(API_KEY=None, REQUIRE_AUTH=True).REQUIRE_AUTH is True
+        assert Settings(API_KEY="secret", REQUIRE_AUTH=False).REQUIRE_AUTH is False
+
+    def test_urls_follow_host_port_and_api_key(self):
+        s = Settings(HOST="example.com", PORT=9000, API_KEY="secret")
+        assert s.server_url == "https://example.com:9000"
+        assert s.mcp_endpoint == "https://example.com:9000/mcp"
+
+    def test_instances_are_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Settings().PORT = 1
+
+
+class TestSubclassOverrides:
+    """Plain class-attribute overrides in subclasses."""
+
+    def test_plain_attributes_become_defaults(self):
+        class Dev(Settings):
+            DEBUG = True
+            LOG_LEVEL = "DEBUG"
+            PORT = 9100
+
+        s = Dev()
+        assert (s.DEBUG, s.LOG_LEVEL, s.PORT) == (True, "DEBUG", 9100)
+        assert s.is_development is True
+        assert s.server_url.endswith(":9100")
+
+    def test_keyword_overrides_still_apply(self):
+        class Dev(Settings):
+            PORT = 9100
+
+        assert Dev(PORT=9200).PORT == 9200
+
+    def test_require_auth_derived_from_subclass_api_key(self):
+        class Secured(Settings):
+            API_KEY = "secret"
+
+        assert Secured().REQUIRE_AUTH is True
+        assert Secured().server_url.startswith("https://")
+
+    def test_require_auth_override(self):
+        class Open(Settings):
+            API_KEY = "secret"
+            REQUIRE_AUTH = False
+
+        assert Open().REQUIRE_AUTH is False
+
+    def test_cors_origins_override(self):
+        class Cors(Settings):
+            CORS_ORIGINS = frozenset({"https://a.example", "https://b.example"})
+
+        s = Cors()
+        assert s.CORS_ORIGINS == {"https://a.example", "https://b.example"}
+        assert s.to_dict()["CORS_ORIGINS"] == s.CORS_ORIGINS
+
+    def test_nested_subclass_inherits_overrides(self):
+        class Dev(Settings):
+            DEBUG = True
+
+        class DevOnOtherPort(Dev):
+            PORT = 9300
+
+        s = DevOnOtherPort()
+        assert (s.DEBUG, s.PORT) == (True, 9300)
+
+    def test_subclass_keeps_base_repr_and_is_frozen(self):
+        class Dev(Settings):
+            PORT = 9100
+
+        s = Dev()
+        assert repr(s).startswith("Settings(")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            s.PORT = 1